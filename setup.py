@@ -29,7 +29,6 @@ setup(
     python_requires=">=3.7",
     install_requires=[
         "python-dotenv>=0.19.0",
-        "tenacity>=8.0.0",  # For retry mechanism
         "aiosmtplib>=2.0.0",  # For async support
     ],
     extras_require={
@@ -3,28 +3,54 @@ py-mail-me is a simple Python package for sending email notifications after task
 """
 
 import os
+import io
+import base64
+import copy
+import hashlib
 import smtplib
 import logging
+import logging.handlers
 import asyncio
-import aiosmtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
-from functools import wraps
-from typing import Optional, Union, List, Dict, Any, Callable
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.message import EmailMessage, MIMEPart
+from email.policy import SMTP as SMTP_POLICY
+from email.headerregistry import Address
+from email.errors import HeaderParseError
+from email.utils import getaddresses
+from functools import wraps, lru_cache, partial
+from typing import Optional, Union, List, Dict, Any, Callable, TYPE_CHECKING
 from pathlib import Path
 import tempfile
-from datetime import datetime
-import ssl
 import atexit
-from tenacity import retry, stop_after_attempt, wait_exponential
+import time
 
 from .exceptions import EmailConfigError, EmailAuthError, EmailSendError
-from .templates import EmailTemplate, SUCCESS_TEMPLATE, ERROR_TEMPLATE
+from .templates import EmailTemplate, get_success_template, get_error_template
+
+if TYPE_CHECKING:
+    import ssl
+    import aiosmtplib
+
+def __getattr__(name: str) -> Any:
+    # Default templates are built lazily; see templates.__getattr__
+    if name in ('SUCCESS_TEMPLATE', 'ERROR_TEMPLATE'):
+        from . import templates
+        return getattr(templates, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Shared formatter and naming for captured task logs
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_TASK_LOG_PREFIX = 'task_log_'
+_TASK_LOG_SUFFIX = '.txt'
+
+# Spilled logs are base64-encoded in chunks of whole 57-byte MIME lines
+_BASE64_CHUNK_SIZE = 57 * 1024
+
 # Global set to track temporary files
 _temp_files = set()
 
@@ -40,6 +66,210 @@ def cleanup_temp_files():
 # Register cleanup function
 atexit.register(cleanup_temp_files)
 
+def _write_all(fd: int, data: bytes):
+    """Write all of data to a file descriptor, continuing after short writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+class _SpillingLogHandler(logging.Handler):
+    """Buffer log records in memory, spilling to a temporary file past a size limit in bytes"""
+    terminator = '\n'
+    
+    def __init__(self, limit: int):
+        super().__init__()
+        self.buffer = io.BytesIO()
+        self.limit = limit
+        self.fd = None
+        self.path = None
+    
+    def emit(self, record):
+        try:
+            data = (self.format(record) + self.terminator).encode('utf-8')
+            if self.fd is None:
+                self.buffer.write(data)
+                if self.buffer.tell() > self.limit:
+                    self._spill()
+            else:
+                # Once spilled, write encoded records straight to the file descriptor
+                _write_all(self.fd, data)
+        except Exception:
+            self.handleError(record)
+    
+    def _spill(self):
+        """Move the buffered logs to a temporary file and write there from now on"""
+        self.fd, self.path = tempfile.mkstemp(prefix=_TASK_LOG_PREFIX, suffix=_TASK_LOG_SUFFIX)
+        _temp_files.add(self.path)
+        _write_all(self.fd, self.buffer.getvalue())
+        self.buffer = io.BytesIO()
+    
+    def read_text(self) -> str:
+        """Return the captured logs"""
+        if self.path is None:
+            return self.buffer.getvalue().decode('utf-8', errors='replace')
+        return Path(self.path).read_text(encoding='utf-8', errors='replace')
+    
+    def read_base64(self) -> str:
+        """Return the captured logs base64-encoded, streaming spilled files in chunks"""
+        if self.path is None:
+            return base64.encodebytes(self.buffer.getvalue()).decode('ascii')
+        
+        encoded = io.StringIO()
+        with open(self.path, 'rb') as f:
+            for chunk in iter(partial(f.read, _BASE64_CHUNK_SIZE), b''):
+                encoded.write(base64.encodebytes(chunk).decode('ascii'))
+        return encoded.getvalue()
+    
+    def close(self):
+        try:
+            if self.fd is not None:
+                os.close(self.fd)
+                self.fd = None
+                # Remove the spill file now rather than leaving it for exit cleanup
+                try:
+                    os.unlink(self.path)
+                    _temp_files.discard(self.path)
+                except OSError:
+                    pass
+        finally:
+            super().close()
+
+# TLS context shared by all connections; read-only use by starttls is thread-safe
+_SSL_CONTEXT: Optional["ssl.SSLContext"] = None
+
+def _get_ssl_context() -> "ssl.SSLContext":
+    """Get the shared default TLS context, creating it on first use"""
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        import ssl
+        _SSL_CONTEXT = ssl.create_default_context()
+    return _SSL_CONTEXT
+
+# Seconds before a blocking SMTP connect or command gives up
+_SMTP_TIMEOUT = 30
+
+# Pools of authenticated SMTP connections, keyed by (host, port, username, password hash, use_tls)
+_SMTP_POOL: Dict[tuple, queue.Queue] = {}
+_SMTP_POOL_LOCK = threading.Lock()
+
+# Async pools are bound to the event loop that created their connections
+_ASYNC_SMTP_POOLS: Dict[asyncio.AbstractEventLoop, tuple] = {}
+
+def _get_smtp_pool(key: tuple) -> queue.Queue:
+    """Get the connection pool for the given key, creating it if needed"""
+    with _SMTP_POOL_LOCK:
+        pool = _SMTP_POOL.get(key)
+        if pool is None:
+            pool = _SMTP_POOL[key] = queue.Queue()
+        return pool
+
+def _close_async_pools(pools: Dict[tuple, list]):
+    """Close the pooled clients of one event loop"""
+    for pool in pools.values():
+        for smtp in pool:
+            try:
+                smtp.close()
+            except Exception as e:
+                logger.debug(f"Failed to close pooled async SMTP connection: {e}")
+    pools.clear()
+
+async def _async_pool_lifetime(loop: asyncio.AbstractEventLoop, pools: Dict[tuple, list]):
+    """Close a loop's pool when the loop shuts down its async generators, as asyncio.run() does"""
+    try:
+        yield
+    finally:
+        _ASYNC_SMTP_POOLS.pop(loop, None)
+        _close_async_pools(pools)
+
+async def _get_async_smtp_pool():
+    """Get the (lock, pools) pair for the running event loop"""
+    loop = asyncio.get_running_loop()
+    entry = _ASYNC_SMTP_POOLS.get(loop)
+    if entry is None:
+        # Drop pools left behind by loops closed without shutting down their async generators
+        for closed in [other for other in _ASYNC_SMTP_POOLS if other.is_closed()]:
+            _close_async_pools(_ASYNC_SMTP_POOLS.pop(closed)[1])
+        
+        pools = {}
+        lifetime = _async_pool_lifetime(loop, pools)
+        entry = _ASYNC_SMTP_POOLS[loop] = (asyncio.Lock(), pools, lifetime)
+        await lifetime.asend(None)
+    return entry[:2]
+
+def close_smtp_pool():
+    """Close pooled SMTP connections at program exit"""
+    with _SMTP_POOL_LOCK:
+        pools = list(_SMTP_POOL.values())
+        _SMTP_POOL.clear()
+    for pool in pools:
+        while True:
+            try:
+                server = pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                server.quit()
+            except Exception as e:
+                logger.debug(f"Failed to close pooled SMTP connection: {e}")
+
+# Register pool cleanup function
+atexit.register(close_smtp_pool)
+
+def _is_transient_code(code: int) -> bool:
+    """Whether an SMTP reply code reports a temporary (4xx) failure"""
+    return 400 <= code < 500
+
+def _is_transient_error(e: Exception) -> bool:
+    """Whether a smtplib send failure is worth retrying"""
+    if isinstance(e, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    if isinstance(e, smtplib.SMTPRecipientsRefused):
+        return any(_is_transient_code(code) for code, _ in e.recipients.values())
+    if isinstance(e, smtplib.SMTPResponseException):
+        return _is_transient_code(e.smtp_code)
+    # Other SMTP errors are permanent; SMTPException subclasses OSError, so check it first
+    return not isinstance(e, smtplib.SMTPException) and isinstance(e, OSError)
+
+def _is_transient_async_error(e: Exception) -> bool:
+    """Whether an aiosmtplib send failure is worth retrying"""
+    import aiosmtplib
+    
+    if isinstance(e, (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPConnectError, aiosmtplib.SMTPTimeoutError)):
+        return True
+    if isinstance(e, aiosmtplib.SMTPRecipientsRefused):
+        return any(_is_transient_code(refusal.code) for refusal in e.recipients)
+    if isinstance(e, aiosmtplib.SMTPResponseException):
+        return _is_transient_code(e.code)
+    return not isinstance(e, aiosmtplib.SMTPException) and isinstance(e, OSError)
+
+@lru_cache(maxsize=1)
+def _default_config() -> Dict[str, Any]:
+    """
+    Read SMTP defaults from the environment once.
+    
+    Call _default_config.cache_clear() to pick up changed environment variables.
+    """
+    return {
+        "host": os.getenv("EMAIL_HOST", "smtp.gmail.com"),
+        "port": os.getenv("EMAIL_PORT", "587"),
+        "username": os.getenv("EMAIL_USER"),
+        "password": os.getenv("EMAIL_PASSWORD"),
+    }
+
+# Background worker for notifications sent from sync context managers in async mode
+_SEND_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_SEND_EXECUTOR_LOCK = threading.Lock()
+
+def _get_send_executor() -> ThreadPoolExecutor:
+    """Get the background send executor, creating it on first use"""
+    global _SEND_EXECUTOR
+    with _SEND_EXECUTOR_LOCK:
+        if _SEND_EXECUTOR is None:
+            _SEND_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='py-mail-me')
+            # Flush pending notifications at exit, before pooled connections are closed
+            atexit.register(_SEND_EXECUTOR.shutdown, wait=True)
+        return _SEND_EXECUTOR
+
 class EmailNotifier:
     def __init__(
         self,
@@ -53,7 +283,10 @@ class EmailNotifier:
         use_tls: bool = True,
         max_retries: int = 3,
         template: Optional[EmailTemplate] = None,
-        async_mode: bool = False
+        async_mode: bool = False,
+        log_buffer_bytes: int = 1_048_576,
+        capture_loggers: Optional[List[str]] = None,
+        log_level: int = logging.NOTSET
     ):
         """
         Initialize EmailNotifier.
@@ -70,55 +303,97 @@ class EmailNotifier:
             max_retries: Maximum number of retry attempts
             template: Custom email template
             async_mode: Whether to send emails asynchronously
+            log_buffer_bytes: Size of captured logs kept in memory before spilling to a temporary file
+            capture_loggers: Names of loggers to capture (defaults to the root logger)
+            log_level: Minimum level of captured log records
         """
-        self.email = [email] if isinstance(email, str) else email
+        recipients = [email] if isinstance(email, str) else list(email or ())
+        if not recipients or not all(addr and isinstance(addr, str) for addr in recipients):
+            raise EmailConfigError("Recipient email address not provided")
+        
+        self.email = recipients
         self.subject = subject
         self.attach_logs = attach_logs
-        self.host = host or os.getenv("EMAIL_HOST", "smtp.gmail.com")
-        self.port = port or int(os.getenv("EMAIL_PORT", "587"))
-        self.username = username or os.getenv("EMAIL_USER")
-        self.password = password or os.getenv("EMAIL_PASSWORD")
+        config = _default_config()
+        self.host = host or config["host"]
+        self.port = port or int(config["port"])
+        self.username = username or config["username"]
+        self.password = password or config["password"]
         self.use_tls = use_tls
         self.max_retries = max_retries
-        self.template = template or SUCCESS_TEMPLATE
+        self.template = template or get_success_template()
         self.async_mode = async_mode
+        self.log_buffer_bytes = log_buffer_bytes
+        self.capture_loggers = capture_loggers or ['']
+        self.log_level = log_level
+        self._pool_key = (
+            self.host,
+            self.port,
+            self.username,
+            hashlib.sha256((self.password or '').encode('utf-8')).hexdigest(),
+            self.use_tls
+        )
         
         if not all([self.username, self.password]):
             raise EmailConfigError("Email credentials not provided")
-            
-        self.log_file = None
+        
+        # Parse addresses once; fall back to raw strings for anything but bare addresses
+        try:
+            self._from_header = Address(addr_spec=self.username)
+        except (ValueError, IndexError, HeaderParseError):
+            self._from_header = self.username
+        try:
+            self._to_header = tuple(Address(addr_spec=addr) for addr in self.email)
+        except (ValueError, IndexError, HeaderParseError):
+            self._to_header = ', '.join(self.email)
+        
+        # Envelope recipients; a single string may hold several comma-separated addresses
+        self._envelope = []
+        for entry in self.email:
+            addrs = [addr for _, addr in getaddresses([entry]) if addr]
+            if not addrs:
+                raise EmailConfigError(f"Invalid recipient email address: {entry!r}")
+            self._envelope.extend(addrs)
+        
+        self._init_run_state()
+        logger.debug(f"Initialized EmailNotifier for {self.email}")
+    
+    def _init_run_state(self):
+        """Reset the state of a single notification: pending send and log capture"""
+        self.send_future: Optional[Future] = None
         self.log_handler = None
+        self._log_buffer = None
+        self._log_queue = None
+        self._listener = None
+        self._logging_started = False
         if self.attach_logs:
             self._setup_logging()
-        
-        logger.debug(f"Initialized EmailNotifier for {self.email}")
+    
+    def _clone(self, async_mode: bool) -> "EmailNotifier":
+        """Copy this notifier's validated configuration into a fresh notifier without re-validating"""
+        notifier = copy.copy(self)
+        notifier.async_mode = async_mode
+        notifier._init_run_state()
+        return notifier
     
     def _setup_logging(self):
-        """Set up logging with a temporary file"""
+        """Set up logging with an in-memory buffer"""
         try:
-            # Create a temporary file and track it
-            self.log_file = tempfile.NamedTemporaryFile(
-                mode='w',
-                delete=False,
-                prefix='task_log_',
-                suffix='.txt'
-            )
-            _temp_files.add(self.log_file.name)
+            # Create and configure the buffering handler
+            self._log_buffer = _SpillingLogHandler(self.log_buffer_bytes)
+            self._log_buffer.setFormatter(_LOG_FORMATTER)
             
-            # Create and configure the handler
-            self.log_handler = logging.FileHandler(self.log_file.name)
-            self.log_handler.setFormatter(
-                logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            # Callers only enqueue records; a background listener formats and buffers them
+            self._log_queue = queue.SimpleQueue()
+            self.log_handler = logging.handlers.QueueHandler(self._log_queue)
+            self.log_handler.setLevel(self.log_level)
+            self._listener = logging.handlers.QueueListener(
+                self._log_queue,
+                self._log_buffer,
+                respect_handler_level=True
             )
         except Exception as e:
             logger.error(f"Failed to set up logging: {e}")
-            if self.log_file:
-                try:
-                    self.log_file.close()
-                    os.unlink(self.log_file.name)
-                    _temp_files.discard(self.log_file.name)
-                except:
-                    pass
             raise
             
     def __enter__(self):
@@ -132,11 +407,17 @@ class EmailNotifier:
                 self.stop_logging()
             
             if self.async_mode:
-                asyncio.create_task(self.send_notification_async(error=exc_val if exc_type else None))
+                # Send on the background worker; resources are released once it is done
+                self.send_future = _get_send_executor().submit(
+                    self.send_notification,
+                    error=exc_val if exc_type else None
+                )
+                self.send_future.add_done_callback(lambda _: self._cleanup())
             else:
                 self.send_notification(error=exc_val if exc_type else None)
         finally:
-            self._cleanup()
+            if self.send_future is None:
+                self._cleanup()
 
     async def __aenter__(self):
         if self.attach_logs:
@@ -156,17 +437,23 @@ class EmailNotifier:
             await self._cleanup_async()
                 
     def start_logging(self):
-        """Start capturing logs"""
-        if self.log_handler:
-            logging.getLogger().addHandler(self.log_handler)
+        """Start capturing logs; calling it again while capturing does nothing"""
+        if self.log_handler and not self._logging_started:
+            self._logging_started = True
+            self._listener.start()
+            for name in self.capture_loggers:
+                logging.getLogger(name).addHandler(self.log_handler)
             logger.debug("Started log capture")
         
     def stop_logging(self):
-        """Stop capturing logs"""
-        if self.log_handler:
+        """Stop capturing logs; calling it when not capturing does nothing"""
+        if self.log_handler and self._logging_started:
+            self._logging_started = False
             try:
-                logging.getLogger().removeHandler(self.log_handler)
-                self.log_handler.close()
+                for name in self.capture_loggers:
+                    logging.getLogger(name).removeHandler(self.log_handler)
+                # Stopping the listener flushes queued records to the buffer
+                self._listener.stop()
                 logger.debug("Stopped log capture")
             except Exception as e:
                 logger.error(f"Error stopping log capture: {e}")
@@ -176,84 +463,93 @@ class EmailNotifier:
         if self.log_handler:
             try:
                 self.log_handler.close()
+                self._log_buffer.close()
             except:
                 pass
             self.log_handler = None
-        
-        if self.log_file:
-            try:
-                self.log_file.close()
-            except:
-                pass
-            self.log_file = None
+            self._log_buffer = None
+            self._listener = None
 
     async def _cleanup_async(self):
         """Clean up resources asynchronously"""
         self._cleanup()
         await asyncio.sleep(0)  # Give event loop a chance to handle file operations
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry_error_callback=lambda retry_state: retry_state.outcome.result()
-    )
+    def _retry_delay(self, attempt: int) -> int:
+        """Exponential backoff between send attempts: 4, 8, then 10 seconds"""
+        return min(10, 4 << attempt)
+    
     async def send_notification_async(self, error: Optional[Exception] = None):
         """Send email notification asynchronously"""
+        import aiosmtplib
+        
         try:
-            msg = await self._prepare_email(error)
-            
-            # Use aiosmtplib for async SMTP operations
-            smtp = aiosmtplib.SMTP(
-                hostname=self.host,
-                port=self.port,
-                start_tls=self.use_tls
-            )
-            
-            await smtp.connect()
-            await smtp.login(self.username, self.password)
-            await smtp.send_message(msg)
-            await smtp.quit()
-            
-            logger.info(f"Async email sent successfully to {self.email}")
-            
-        except aiosmtplib.SMTPAuthenticationError as e:
-            logger.error(f"SMTP authentication failed: {e}")
-            raise EmailAuthError(f"SMTP authentication failed: {e}")
+            # Serialize once; the same bytes are reused for every recipient and retry
+            raw = self._prepare_email(error).as_bytes(policy=SMTP_POLICY)
         except Exception as e:
             logger.error(f"Failed to send email: {e}")
             raise EmailSendError(f"Failed to send email: {e}")
+        
+        pending = list(self._envelope)
+        attempts = max(1, self.max_retries)
+        for attempt in range(attempts):
+            try:
+                await self._send_email_async(raw, pending)
+                logger.info(f"Async email sent successfully to {self.email}")
+                return
+            except aiosmtplib.SMTPAuthenticationError as e:
+                logger.error(f"SMTP authentication failed: {e}")
+                raise EmailAuthError(f"SMTP authentication failed: {e}")
+            except Exception as e:
+                # Only dropped connections, network errors and 4xx replies are worth retrying
+                logger.error(f"Failed to send email: {e}")
+                if attempt + 1 >= attempts or not _is_transient_async_error(e):
+                    raise EmailSendError(f"Failed to send email: {e}")
+                await asyncio.sleep(self._retry_delay(attempt))
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry_error_callback=lambda retry_state: retry_state.outcome.result()
-    )
     def send_notification(self, error: Optional[Exception] = None):
         """Send email notification synchronously"""
         try:
-            msg = asyncio.run(self._prepare_email(error))
-            self._send_email(msg)
-            logger.info(f"Email sent successfully to {self.email}")
-            
-        except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"SMTP authentication failed: {e}")
-            raise EmailAuthError(f"SMTP authentication failed: {e}")
+            # Serialize once; the same bytes are reused for every recipient and retry
+            raw = self._prepare_email(error).as_bytes(policy=SMTP_POLICY)
         except Exception as e:
             logger.error(f"Failed to send email: {e}")
             raise EmailSendError(f"Failed to send email: {e}")
+        
+        pending = list(self._envelope)
+        attempts = max(1, self.max_retries)
+        for attempt in range(attempts):
+            try:
+                self._send_email(raw, pending)
+                logger.info(f"Email sent successfully to {self.email}")
+                return
+            except smtplib.SMTPAuthenticationError as e:
+                logger.error(f"SMTP authentication failed: {e}")
+                raise EmailAuthError(f"SMTP authentication failed: {e}")
+            except Exception as e:
+                # Only dropped connections, network errors and 4xx replies are worth retrying
+                logger.error(f"Failed to send email: {e}")
+                if attempt + 1 >= attempts or not _is_transient_error(e):
+                    raise EmailSendError(f"Failed to send email: {e}")
+                time.sleep(self._retry_delay(attempt))
     
-    async def _prepare_email(self, error: Optional[Exception] = None) -> MIMEMultipart:
+    def _prepare_email(self, error: Optional[Exception] = None) -> EmailMessage:
         """Prepare email message with template"""
-        msg = MIMEMultipart('alternative')
-        msg['From'] = self.username
-        msg['To'] = ', '.join(self.email)
+        msg = EmailMessage()
+        msg['From'] = self._from_header
+        msg['To'] = self._to_header
         msg['Subject'] = self.subject
         
-        # Get log content if available
+        # A plain success notice with the default template needs no rendering
+        if self.template is get_success_template() and error is None and not self.attach_logs:
+            msg.set_content("Task completed successfully!")
+            return msg
+        
+        now = time.localtime()
+        
         log_content = ""
-        if self.attach_logs and self.log_file:
-            with open(self.log_file.name, 'r') as f:
-                log_content = f.read()
+        if self.attach_logs and self._log_buffer:
+            log_content = self._log_buffer.read_text()
         
         # Render template
         content = self.template.render(
@@ -261,35 +557,165 @@ class EmailNotifier:
             message="Task completed successfully!" if not error else "Task failed!",
             details=log_content,
             error=error,
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp=time.strftime("%Y-%m-%d %H:%M:%S", now)
         )
         
-        # Attach both HTML and text versions
-        msg.attach(MIMEText(content['text'], 'plain'))
-        msg.attach(MIMEText(content['html'], 'html'))
+        # Text body with an HTML alternative
+        msg.set_content(content['text'])
+        msg.add_alternative(content['html'], subtype='html')
         
-        # Attach log file if enabled
-        if self.attach_logs and self.log_file:
-            with open(self.log_file.name, 'rb') as f:
-                log_attachment = MIMEApplication(f.read(), _subtype='txt')
-                log_attachment.add_header(
-                    'Content-Disposition',
-                    'attachment',
-                    filename=f'task_log_{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt'
-                )
-                msg.attach(log_attachment)
+        # Attach log file if enabled, with the payload already base64-encoded
+        if self.attach_logs and self._log_buffer:
+            attachment = MIMEPart()
+            attachment['Content-Type'] = 'text/plain; charset="utf-8"'
+            attachment['Content-Transfer-Encoding'] = 'base64'
+            attachment.add_header(
+                'Content-Disposition',
+                'attachment',
+                filename=time.strftime(f"{_TASK_LOG_PREFIX}%Y%m%d_%H%M%S{_TASK_LOG_SUFFIX}", now)
+            )
+            attachment.set_payload(self._log_buffer.read_base64())
+            
+            # Wrap the alternative bodies in multipart/mixed alongside the attachment
+            msg.make_mixed()
+            msg.attach(attachment)
         
         return msg
     
-    def _send_email(self, msg: MIMEMultipart):
-        """Send email using SMTP"""
-        context = ssl.create_default_context() if self.use_tls else None
-        
-        with smtplib.SMTP(self.host, self.port) as server:
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection"""
+        server = smtplib.SMTP(self.host, self.port, timeout=_SMTP_TIMEOUT)
+        try:
             if self.use_tls:
-                server.starttls(context=context)
+                server.starttls(context=_get_ssl_context())
             server.login(self.username, self.password)
-            server.send_message(msg)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _acquire_connection(self) -> smtplib.SMTP:
+        """Take a live connection from the pool, or open a new one"""
+        pool = _get_smtp_pool(self._pool_key)
+        while True:
+            try:
+                server = pool.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            
+            # Probe liveness before reuse
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+            server.close()
+    
+    def _deliver(self, server: smtplib.SMTP, raw: bytes, pending: List[str]):
+        """Send the message to each pending recipient, dropping those delivered"""
+        refused = {}
+        for addr in list(pending):
+            try:
+                server.sendmail(self.username, [addr], raw)
+            except smtplib.SMTPRecipientsRefused as e:
+                # Keep going; one refused recipient must not hold up the others
+                refused.update(e.recipients)
+                continue
+            pending.remove(addr)
+        if refused:
+            raise smtplib.SMTPRecipientsRefused(refused)
+    
+    def _send_email(self, raw: bytes, pending: List[str]):
+        """Send email using a pooled SMTP connection"""
+        server = self._acquire_connection()
+        try:
+            try:
+                self._deliver(server, raw, pending)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError):
+                logger.debug("Pooled SMTP connection dropped, reconnecting")
+                server.close()
+                server = self._connect()
+                self._deliver(server, raw, pending)
+        except Exception:
+            server.close()
+            raise
+        
+        _get_smtp_pool(self._pool_key).put(server)
+    
+    async def _connect_async(self) -> "aiosmtplib.SMTP":
+        """Open and authenticate a new async SMTP connection"""
+        import aiosmtplib
+        
+        smtp = aiosmtplib.SMTP(
+            hostname=self.host,
+            port=self.port,
+            timeout=_SMTP_TIMEOUT,
+            start_tls=self.use_tls,
+            tls_context=_get_ssl_context() if self.use_tls else None
+        )
+        
+        await smtp.connect()
+        try:
+            await smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+    
+    async def _acquire_connection_async(self) -> "aiosmtplib.SMTP":
+        """Take a live connection from the event loop's pool, or open a new one"""
+        import aiosmtplib
+        
+        lock, pools = await _get_async_smtp_pool()
+        async with lock:
+            pool = pools.setdefault(self._pool_key, [])
+            while pool:
+                smtp = pool.pop()
+                
+                # Probe liveness before reuse
+                try:
+                    await smtp.noop()
+                    return smtp
+                except (aiosmtplib.SMTPException, OSError):
+                    smtp.close()
+        return await self._connect_async()
+    
+    async def _deliver_async(self, smtp: "aiosmtplib.SMTP", raw: bytes, pending: List[str]):
+        """Send the message to each pending recipient, dropping those delivered"""
+        import aiosmtplib
+        
+        refused = []
+        for addr in list(pending):
+            try:
+                await smtp.sendmail(self.username, [addr], raw)
+            except aiosmtplib.SMTPRecipientsRefused as e:
+                # Keep going; one refused recipient must not hold up the others
+                refused.extend(e.recipients)
+                continue
+            pending.remove(addr)
+        if refused:
+            raise aiosmtplib.SMTPRecipientsRefused(refused)
+    
+    async def _send_email_async(self, raw: bytes, pending: List[str]):
+        """Send email using a pooled async SMTP connection"""
+        import aiosmtplib
+        
+        smtp = await self._acquire_connection_async()
+        try:
+            try:
+                await self._deliver_async(smtp, raw, pending)
+            except (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPConnectError):
+                logger.debug("Pooled async SMTP connection dropped, reconnecting")
+                smtp.close()
+                smtp = await self._connect_async()
+                await self._deliver_async(smtp, raw, pending)
+        except Exception:
+            smtp.close()
+            raise
+        
+        lock, pools = await _get_async_smtp_pool()
+        async with lock:
+            pools.setdefault(self._pool_key, []).append(smtp)
 
 def py_mail_me(
     email: Union[str, List[str]],
@@ -302,45 +728,44 @@ def py_mail_me(
     use_tls: bool = True,
     max_retries: int = 3,
     template: Optional[EmailTemplate] = None,
-    async_mode: bool = False
+    async_mode: bool = False,
+    log_buffer_bytes: int = 1_048_576,
+    capture_loggers: Optional[List[str]] = None,
+    log_level: int = logging.NOTSET
 ):
     """Decorator for sending email notifications after task completion"""
     def decorator(func: Callable):
+        # Resolve, validate and parse the configuration once, at decoration time
+        prototype = EmailNotifier(
+            email=email,
+            subject=subject,
+            attach_logs=False,
+            host=host,
+            port=port,
+            username=username,
+            password=password,
+            use_tls=use_tls,
+            max_retries=max_retries,
+            template=template,
+            async_mode=async_mode,
+            log_buffer_bytes=log_buffer_bytes,
+            capture_loggers=capture_loggers,
+            log_level=log_level
+        )
+        # The prototype never captures logs itself; each call builds its own capture
+        prototype.attach_logs = attach_logs
+        
         if asyncio.iscoroutinefunction(func):
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
-                async with EmailNotifier(
-                    email=email,
-                    subject=subject,
-                    attach_logs=attach_logs,
-                    host=host,
-                    port=port,
-                    username=username,
-                    password=password,
-                    use_tls=use_tls,
-                    max_retries=max_retries,
-                    template=template,
-                    async_mode=True
-                ):
+                async with prototype._clone(async_mode=True):
                     return await func(*args, **kwargs)
             return async_wrapper
         else:
             @wraps(func)
             def sync_wrapper(*args, **kwargs):
-                with EmailNotifier(
-                    email=email,
-                    subject=subject,
-                    attach_logs=attach_logs,
-                    host=host,
-                    port=port,
-                    username=username,
-                    password=password,
-                    use_tls=use_tls,
-                    max_retries=max_retries,
-                    template=template,
-                    async_mode=async_mode
-                ):
+                with prototype._clone(async_mode=async_mode):
                     return func(*args, **kwargs)
             return sync_wrapper
         
-    return decorator 
\ No newline at end of file
+    return decorator
@@ -2,11 +2,19 @@
 Email templates for py-mail-me package.
 """
 
-from typing import Dict, Any, Optional
+from __future__ import annotations
+
+import re
+import time
+from typing import TYPE_CHECKING
 from string import Template
+from functools import lru_cache
 from .exceptions import TemplateError
 
-DEFAULT_HTML_TEMPLATE = """
+if TYPE_CHECKING:
+    from typing import Any, Callable, Optional
+
+_DEFAULT_HTML_TEMPLATE_RAW = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -112,6 +120,14 @@ DEFAULT_HTML_TEMPLATE = """
 </html>
 """
 
+def _minify(source: str) -> str:
+    """Strip CSS comments and collapse whitespace in an HTML template"""
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    return re.sub(r'\s+', ' ', source).strip()
+
+# Minified once at import; the readable source stays in _DEFAULT_HTML_TEMPLATE_RAW
+DEFAULT_HTML_TEMPLATE = _minify(_DEFAULT_HTML_TEMPLATE_RAW)
+
 DEFAULT_TEXT_TEMPLATE = """
 ${title}
 ${separator}
@@ -126,15 +142,167 @@ Sent by py-mail-me
 ${timestamp}
 """
 
+_DETAILS_OPEN = '<div class="details">'
+_DETAILS_CLOSE = '</div>'
+_ERROR_OPEN = '<div class="details error">'
+_ERROR_CLOSE = '</div>'
+_STATUS_ERROR = 'error'
+_STATUS_SUCCESS = 'success'
+
+@lru_cache(maxsize=32)
+def _separator(length: int) -> str:
+    """Underline for a text title of the given length"""
+    return '=' * length
+
+@lru_cache(maxsize=64)
+def _compile_template(source: str) -> Template:
+    """Compile a template source once; identical sources share one Template"""
+    return Template(source)
+
+class _TemplateVars:
+    """Template variables in fixed slots; keywords without a slot go to `extra`"""
+    __slots__ = ('title', 'message', 'details', 'status_class', 'error_info', 'timestamp', 'separator', 'extra')
+    
+    def __init__(self, title: Any, message: Any, status_class: str, timestamp: Any, kwargs: dict[str, Any]):
+        self.title = title
+        self.message = message
+        self.details = ""
+        self.status_class = status_class
+        self.error_info = None
+        self.timestamp = timestamp
+        self.separator = None
+        self.extra = {}
+        for name, value in kwargs.items():
+            if name in _SLOT_FIELDS:
+                setattr(self, name, value)
+            else:
+                self.extra[name] = value
+
+# Slots a keyword may set, and those always set by the time a template is rendered
+_SLOT_FIELDS = frozenset(_TemplateVars.__slots__) - {'extra'}
+_ALWAYS_SET_FIELDS = _SLOT_FIELDS - {'separator'}
+
+@lru_cache(maxsize=64)
+def _codegen(source: str) -> Callable[[_TemplateVars], str]:
+    """
+    Generate a render function for a template source.
+    
+    The template is walked once with Template.pattern and turned into a
+    function that joins its static text with the variables, read straight
+    from _TemplateVars slots, so rendering does no regex scanning or dict
+    lookups for the standard fields. Unknown placeholders are left as
+    written, like safe_substitute.
+    """
+    pieces = []
+    literal = []
+    pos = 0
+    for match in Template.pattern.finditer(source):
+        literal.append(source[pos:match.start()])
+        name = match.group('named') or match.group('braced')
+        if name is None:
+            # `$$` escapes and stray `$` both render as a single `$`
+            literal.append('$')
+            pos = match.end()
+            continue
+        
+        if literal:
+            pieces.append(repr(''.join(literal)))
+            literal = []
+        if name in _ALWAYS_SET_FIELDS:
+            pieces.append(f"str(v.{name})")
+        elif name in _SLOT_FIELDS:
+            pieces.append(f"({match.group()!r} if v.{name} is None else str(v.{name}))")
+        else:
+            pieces.append(f"str(get_extra({name!r}, {match.group()!r}))")
+        pos = match.end()
+    literal.append(source[pos:])
+    pieces.append(repr(''.join(literal)))
+    
+    code = (
+        "def _render(v):\n"
+        "    get_extra = v.extra.get\n"
+        f"    return ''.join(({', '.join(pieces)},))\n"
+    )
+    namespace: dict[str, Any] = {}
+    exec(code, namespace)
+    return namespace['_render']
+
+def _render_default_text(v: _TemplateVars) -> str:
+    """Render DEFAULT_TEXT_TEMPLATE; render() always sets all of its variables"""
+    return (
+        f"\n{v.title}\n{v.separator}\n\n{v.message}\n\n{v.details}\n{v.error_info}"
+        f"\n\n---\nSent by py-mail-me\n{v.timestamp}\n"
+    )
+
 class EmailTemplate:
+    __slots__ = ('html_template', 'text_template', '_html_fn', '_text_fn')
+    
     def __init__(
         self,
         html_template: Optional[str] = None,
         text_template: Optional[str] = None
     ):
-        self.html_template = Template(html_template or DEFAULT_HTML_TEMPLATE)
-        self.text_template = Template(text_template or DEFAULT_TEXT_TEMPLATE)
+        self.html_template = _compile_template(html_template or DEFAULT_HTML_TEMPLATE)
+        self.text_template = _compile_template(text_template or DEFAULT_TEXT_TEMPLATE)
+        self._html_fn = _codegen(self.html_template.template)
+        self._text_fn = (
+            _render_default_text
+            if self.text_template.template == DEFAULT_TEXT_TEMPLATE
+            else _codegen(self.text_template.template)
+        )
         
+    def _prepare(
+        self,
+        title: str,
+        message: str,
+        error: Optional[Exception],
+        kwargs: dict[str, Any]
+    ) -> _TemplateVars:
+        """Build the variables shared by the HTML and text versions"""
+        return _TemplateVars(
+            title,
+            message,
+            _STATUS_ERROR if error else _STATUS_SUCCESS,
+            time.strftime("%Y-%m-%d %H:%M:%S"),
+            kwargs
+        )
+    
+    def _set_html_vars(
+        self,
+        template_vars: _TemplateVars,
+        details: str,
+        error: Optional[Exception],
+        error_str: str
+    ):
+        """Set the HTML-specific variables; an explicit error_info keyword wins"""
+        # Convert newlines to <br> for HTML display
+        formatted_details = details.replace('\n', '<br>') if '\n' in details else details
+        formatted_error = error_str.replace('\n', '<br>') if '\n' in error_str else error_str
+        
+        template_vars.details = ''.join((_DETAILS_OPEN, formatted_details, _DETAILS_CLOSE)) if details else ""
+        if template_vars.error_info is None:
+            template_vars.error_info = ''.join((_ERROR_OPEN, formatted_error, _ERROR_CLOSE)) if error else ""
+    
+    def _set_text_vars(
+        self,
+        template_vars: _TemplateVars,
+        title: str,
+        details: str,
+        error: Optional[Exception],
+        error_str: str
+    ):
+        """Set the text-specific variables, overriding any keyword values"""
+        template_vars.separator = _separator(len(title))
+        template_vars.details = details
+        template_vars.error_info = f"\nError: {error_str}" if error else ""
+    
+    def _substitute(self, render_fn: Callable[[_TemplateVars], str], template_vars: _TemplateVars) -> str:
+        """Run a generated render function, reporting failures as TemplateError"""
+        try:
+            return render_fn(template_vars)
+        except (KeyError, ValueError, TypeError) as e:
+            raise TemplateError(f"Failed to render template: {str(e)}") from e
+    
     def render(
         self,
         title: str,
@@ -142,7 +310,7 @@ class EmailTemplate:
         details: str = "",
         error: Optional[Exception] = None,
         **kwargs: Any
-    ) -> Dict[str, str]:
+    ) -> dict[str, str]:
         """
         Render both HTML and text versions of the email.
         
@@ -156,39 +324,68 @@ class EmailTemplate:
         Returns:
             Dict containing 'html' and 'text' versions
         """
-        try:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Convert newlines to <br> for HTML display
-            formatted_details = details.replace('\n', '<br>') if details else ""
-            formatted_error = str(error).replace('\n', '<br>') if error else ""
-            
-            template_vars = {
-                'title': title,
-                'message': message,
-                'details': f'<div class="details">{formatted_details}</div>' if details else "",
-                'status_class': 'error' if error else 'success',
-                'error_info': f'<div class="details error">{formatted_error}</div>' if error else "",
-                'timestamp': timestamp,
-                **kwargs
-            }
-            
-            # Plain text version
-            text_vars = {
-                **template_vars,
-                'separator': '=' * len(title),
-                'details': details or "",
-                'error_info': f"\nError: {str(error)}" if error else ""
-            }
-            
-            return {
-                'html': self.html_template.safe_substitute(template_vars),
-                'text': self.text_template.safe_substitute(text_vars)
-            }
-        except Exception as e:
-            raise TemplateError(f"Failed to render template: {str(e)}")
+        details = details or ""
+        error_str = str(error) if error else ""
+        
+        template_vars = self._prepare(title, message, error, kwargs)
+        self._set_html_vars(template_vars, details, error, error_str)
+        html = self._substitute(self._html_fn, template_vars)
+        
+        # Plain text version reuses the same variables with text-specific values
+        self._set_text_vars(template_vars, title, details, error, error_str)
+        text = self._substitute(self._text_fn, template_vars)
+        
+        return {'html': html, 'text': text}
+    
+    def render_html(
+        self,
+        title: str,
+        message: str,
+        details: str = "",
+        error: Optional[Exception] = None,
+        **kwargs: Any
+    ) -> str:
+        """Render only the HTML version of the email; see render()"""
+        details = details or ""
+        error_str = str(error) if error else ""
+        
+        template_vars = self._prepare(title, message, error, kwargs)
+        self._set_html_vars(template_vars, details, error, error_str)
+        return self._substitute(self._html_fn, template_vars)
+    
+    def render_text(
+        self,
+        title: str,
+        message: str,
+        details: str = "",
+        error: Optional[Exception] = None,
+        **kwargs: Any
+    ) -> str:
+        """Render only the text version of the email; see render()"""
+        error_str = str(error) if error else ""
+        
+        template_vars = self._prepare(title, message, error, kwargs)
+        self._set_text_vars(template_vars, title, details or "", error, error_str)
+        return self._substitute(self._text_fn, template_vars)
+
+# Default templates for different scenarios, built on first use
+@lru_cache(maxsize=None)
+def get_success_template() -> EmailTemplate:
+    """Get the shared default template for successful tasks"""
+    return EmailTemplate()
+
+@lru_cache(maxsize=None)
+def get_error_template() -> EmailTemplate:
+    """Get the shared default template for failed tasks"""
+    return EmailTemplate()
+
+_LAZY_TEMPLATES = {
+    'SUCCESS_TEMPLATE': get_success_template,
+    'ERROR_TEMPLATE': get_error_template,
+}
 
-# Default templates for different scenarios
-SUCCESS_TEMPLATE = EmailTemplate()
-ERROR_TEMPLATE = EmailTemplate() 
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    # Keep SUCCESS_TEMPLATE / ERROR_TEMPLATE importable without building them at import
+    if name in _LAZY_TEMPLATES:
+        return _LAZY_TEMPLATES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")